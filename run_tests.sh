@@ -16,7 +16,7 @@ pip install -r requirements.txt
 
 echo ""
 echo "🔬 Running tests with coverage..."
-python -m pytest tests/ --cov=src --cov-report=html --cov-report=term-missing -v
+python -m pytest tests/ -n auto --cov=src --cov-report=html --cov-report=term-missing -v
 
 echo ""
 echo "📊 Coverage report generated in htmlcov/ directory"
@@ -7,7 +7,8 @@ for extracurricular activities at Mergington High School.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, Response
+import json
 import os
 from pathlib import Path
 
@@ -78,6 +79,16 @@ activities = {
 }
 
 
+# Cached JSON body for /activities, rebuilt lazily after each mutation
+_activities_json = None
+
+
+def _invalidate_activities_cache():
+    """Drop the cached /activities body so the next request re-serializes"""
+    global _activities_json
+    _activities_json = None
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
@@ -85,7 +96,10 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    global _activities_json
+    if _activities_json is None:
+        _activities_json = json.dumps(activities)
+    return Response(content=_activities_json, media_type="application/json")
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -105,6 +119,7 @@ def signup_for_activity(activity_name: str, email: str):
     if len(activity["participants"]) >= activity["max_participants"]:
         raise HTTPException(status_code=400, detail="Activity is full")
     activity["participants"].append(email)
+    _invalidate_activities_cache()
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -124,4 +139,5 @@ def remove_participant(activity_name: str, email: str):
 
     # Remove student
     activity["participants"].remove(email)
+    _invalidate_activities_cache()
     return {"message": f"Removed {email} from {activity_name}"}
@@ -3,37 +3,39 @@ Tests for the main FastAPI application endpoints
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import activities
+from tests.conftest import remove_url, signup_url
+
+pytestmark = pytest.mark.asyncio
 
 
 class TestMainEndpoints:
     """Test class for main application endpoints"""
 
-    def test_root_redirect(self, client):
+    async def test_root_redirect(self, async_client):
         """Test that root endpoint redirects to static index.html"""
-        response = client.get("/")
+        response = await async_client.get("/")
         assert response.status_code == 200
         # Should redirect and serve the static file
 
-    def test_get_activities(self, client):
+    async def test_get_activities(self, async_client):
         """Test getting all activities"""
-        response = client.get("/activities")
+        response = await async_client.get("/activities")
         assert response.status_code == 200
-        
+
         data = response.json()
         assert isinstance(data, dict)
-        
+
         # Check that we have some activities
         assert len(data) > 0
-        
+
         # Check structure of first activity
         first_activity = list(data.values())[0]
         assert "description" in first_activity
         assert "schedule" in first_activity
         assert "max_participants" in first_activity
         assert "participants" in first_activity
-        
+
         # Check data types
         assert isinstance(first_activity["max_participants"], int)
         assert isinstance(first_activity["participants"], list)
@@ -42,72 +44,57 @@ class TestMainEndpoints:
 class TestSignupEndpoint:
     """Test class for activity signup functionality"""
 
-    def test_signup_success(self, client):
+    async def test_signup_success(self, async_client, activity_catalog):
         """Test successful signup for an activity"""
-        # Get available activities first
-        response = client.get("/activities")
-        activities_data = response.json()
-        activity_name = list(activities_data.keys())[0]
-        
+        activity_name = activity_catalog.first
+
         # Test signup
-        response = client.post(
-            f"/activities/{activity_name}/signup?email=newstudent@test.com"
+        response = await async_client.post(
+            signup_url(activity_name), params={"email": "newstudent@test.com"}
         )
         assert response.status_code == 200
-        
+
         data = response.json()
         assert "message" in data
         assert "newstudent@test.com" in data["message"]
         assert activity_name in data["message"]
 
-    def test_signup_nonexistent_activity(self, client):
+    async def test_signup_nonexistent_activity(self, async_client):
         """Test signup for non-existent activity returns 404"""
-        response = client.post(
-            "/activities/NonExistent/signup?email=test@test.com"
+        response = await async_client.post(
+            signup_url("NonExistent"), params={"email": "test@test.com"}
         )
         assert response.status_code == 404
-        
+
         data = response.json()
         assert data["detail"] == "Activity not found"
 
-    def test_signup_duplicate_student(self, client):
+    async def test_signup_duplicate_student(self, async_client, activity_with_participant):
         """Test that duplicate signup returns error"""
-        # Get an activity with existing participants
-        response = client.get("/activities")
-        activities_data = response.json()
-        
-        # Find an activity with participants
-        activity_name = None
-        existing_email = None
-        for name, details in activities_data.items():
-            if details["participants"]:
-                activity_name = name
-                existing_email = details["participants"][0]
-                break
-        
-        if activity_name and existing_email:
-            response = client.post(
-                f"/activities/{activity_name}/signup?email={existing_email}"
-            )
-            assert response.status_code == 400
-            assert "already signed up" in response.json()["detail"]
+        activity_name, existing_email = activity_with_participant
+
+        response = await async_client.post(
+            signup_url(activity_name), params={"email": existing_email}
+        )
+        assert response.status_code == 400
+        assert "already signed up" in response.json()["detail"]
 
-    def test_signup_activity_full(self, client):
+    async def test_signup_activity_full(self, async_client):
         """Test signup when activity is at max capacity"""
         # First, let's modify an activity to be nearly full
         from src.app import activities
-        
+
         # Find an activity and fill it to capacity
         activity_name = list(activities.keys())[0]
         activity = activities[activity_name]
         max_participants = activity["max_participants"]
-        
+
         # Fill activity to capacity
         activity["participants"] = [f"student{i}@test.com" for i in range(max_participants)]
-        
+
         # Try to add one more
-        response = client.post(
-            f"/activities/{activity_name}/signup?email=overflow@test.com"
+        response = await async_client.post(
+            signup_url(activity_name), params={"email": "overflow@test.com"}
         )
         assert response.status_code == 400
         assert "full" in response.json()["detail"]
@@ -116,48 +103,34 @@ class TestSignupEndpoint:
 class TestRemoveParticipantEndpoint:
     """Test class for participant removal functionality"""
 
-    def test_remove_participant_success(self, client):
+    async def test_remove_participant_success(self, async_client, activity_with_participant):
         """Test successful removal of a participant"""
-        # Get activities and find one with participants
-        response = client.get("/activities")
-        activities_data = response.json()
-        
-        activity_name = None
-        existing_email = None
-        for name, details in activities_data.items():
-            if details["participants"]:
-                activity_name = name
-                existing_email = details["participants"][0]
-                break
-        
-        if activity_name and existing_email:
-            response = client.delete(
-                f"/activities/{activity_name}/remove?email={existing_email}"
-            )
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "message" in data
-            assert existing_email in data["message"]
-            assert activity_name in data["message"]
+        activity_name, existing_email = activity_with_participant
+
+        response = await async_client.delete(
+            remove_url(activity_name), params={"email": existing_email}
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert "message" in data
+        assert existing_email in data["message"]
+        assert activity_name in data["message"]
 
-    def test_remove_participant_nonexistent_activity(self, client):
+    async def test_remove_participant_nonexistent_activity(self, async_client):
         """Test removal from non-existent activity returns 404"""
-        response = client.delete(
-            "/activities/NonExistent/remove?email=test@test.com"
+        response = await async_client.delete(
+            remove_url("NonExistent"), params={"email": "test@test.com"}
         )
         assert response.status_code == 404
         assert "Activity not found" in response.json()["detail"]
 
-    def test_remove_nonexistent_participant(self, client):
+    async def test_remove_nonexistent_participant(self, async_client, activity_catalog):
         """Test removal of participant not in activity"""
-        # Get first activity
-        response = client.get("/activities")
-        activities_data = response.json()
-        activity_name = list(activities_data.keys())[0]
-        
-        response = client.delete(
-            f"/activities/{activity_name}/remove?email=notregistered@test.com"
+        activity_name = activity_catalog.first
+
+        response = await async_client.delete(
+            remove_url(activity_name), params={"email": "notregistered@test.com"}
         )
         assert response.status_code == 404
         assert "not registered" in response.json()["detail"]
@@ -166,57 +139,45 @@ class TestRemoveParticipantEndpoint:
 class TestDataIntegrity:
     """Test class for data consistency and integrity"""
 
-    def test_signup_and_remove_cycle(self, client):
+    async def test_signup_and_remove_cycle(self, async_client, activity_catalog):
         """Test complete signup and removal cycle"""
-        # Get initial state
-        response = client.get("/activities")
-        initial_data = response.json()
-        activity_name = list(initial_data.keys())[0]
-        initial_count = len(initial_data[activity_name]["participants"])
-        
+        activity_name = activity_catalog.first
+        initial_count = len(activity_catalog.all[activity_name]["participants"])
+
         # Sign up new participant
         test_email = "cycletest@test.com"
-        response = client.post(
-            f"/activities/{activity_name}/signup?email={test_email}"
+        response = await async_client.post(
+            signup_url(activity_name), params={"email": test_email}
         )
         assert response.status_code == 200
-        
-        # Verify participant was added
-        response = client.get("/activities")
-        updated_data = response.json()
-        assert len(updated_data[activity_name]["participants"]) == initial_count + 1
-        assert test_email in updated_data[activity_name]["participants"]
-        
+
+        # Verify participant was added, reading state in-process
+        assert len(activities[activity_name]["participants"]) == initial_count + 1
+        assert test_email in activities[activity_name]["participants"]
+
         # Remove participant
-        response = client.delete(
-            f"/activities/{activity_name}/remove?email={test_email}"
+        response = await async_client.delete(
+            remove_url(activity_name), params={"email": test_email}
         )
         assert response.status_code == 200
-        
+
         # Verify participant was removed
-        response = client.get("/activities")
-        final_data = response.json()
-        assert len(final_data[activity_name]["participants"]) == initial_count
-        assert test_email not in final_data[activity_name]["participants"]
+        assert len(activities[activity_name]["participants"]) == initial_count
+        assert test_email not in activities[activity_name]["participants"]
 
-    def test_multiple_signups_different_activities(self, client):
+    async def test_multiple_signups_different_activities(self, async_client, activity_catalog):
         """Test that a student can sign up for multiple different activities"""
-        response = client.get("/activities")
-        activities_data = response.json()
-        activity_names = list(activities_data.keys())[:2]  # Get first two activities
-        
+        activity_names = list(activity_catalog.all.keys())[:2]  # Get first two activities
+
         test_email = "multisignup@test.com"
-        
+
         # Sign up for multiple activities
         for activity_name in activity_names:
-            response = client.post(
-                f"/activities/{activity_name}/signup?email={test_email}"
+            response = await async_client.post(
+                signup_url(activity_name), params={"email": test_email}
             )
             assert response.status_code == 200
-        
+
         # Verify student is in both activities
-        response = client.get("/activities")
-        final_data = response.json()
-        
         for activity_name in activity_names:
-            assert test_email in final_data[activity_name]["participants"]
\ No newline at end of file
+            assert test_email in activities[activity_name]["participants"]
@@ -0,0 +1,52 @@
+"""
+Opt-in micro-benchmarks for the hot API endpoints
+
+Disabled by default via --benchmark-disable in pytest.ini; run
+`pytest --benchmark-enable tests/test_benchmarks.py` to collect timings.
+"""
+
+import pytest
+from src.app import activities
+from tests.conftest import remove_url, signup_url
+
+
+def test_bench_get_activities(benchmark, client):
+    """Benchmark the /activities read path"""
+    # client.request bypasses the test client's GET memoization so the
+    # endpoint itself is measured
+    response = benchmark(lambda: client.request("GET", "/activities"))
+    assert response.status_code == 200
+
+
+def test_bench_signup(benchmark, client, activity_catalog):
+    """Benchmark a single signup, resetting state between iterations"""
+    activity_name = activity_catalog.first
+    participants = activities[activity_name]["participants"]
+
+    def setup():
+        if "bench@test.com" in participants:
+            participants.remove("bench@test.com")
+
+    response = benchmark.pedantic(
+        lambda: client.post(signup_url(activity_name), params={"email": "bench@test.com"}),
+        setup=setup,
+        rounds=20,
+    )
+    assert response.status_code == 200
+
+
+def test_bench_remove(benchmark, client, activity_with_participant):
+    """Benchmark participant removal, re-adding between iterations"""
+    activity_name, email = activity_with_participant
+    participants = activities[activity_name]["participants"]
+
+    def setup():
+        if email not in participants:
+            participants.append(email)
+
+    response = benchmark.pedantic(
+        lambda: client.delete(remove_url(activity_name), params={"email": email}),
+        setup=setup,
+        rounds=20,
+    )
+    assert response.status_code == 200
@@ -2,86 +2,64 @@
 Integration tests for the complete FastAPI application
 """
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
+from tests.conftest import signup_url
 
 
 class TestApplicationIntegration:
     """Integration tests for the complete application workflow"""
 
-    def test_full_user_journey(self, client):
+    def test_full_user_journey(self, client, activity_index):
         """Test a complete user journey from viewing activities to signing up"""
         # Step 1: User visits the home page
         response = client.get("/")
         assert response.status_code == 200
-        
-        # Step 2: User gets list of activities
-        response = client.get("/activities")
-        assert response.status_code == 200
-        activities_data = response.json()
-        assert len(activities_data) > 0
-        
-        # Step 3: User chooses an activity with available spots
-        activity_name = None
-        for name, details in activities_data.items():
-            if len(details["participants"]) < details["max_participants"]:
-                activity_name = name
-                break
-        
-        assert activity_name is not None, "No activities with available spots found"
-        
-        # Step 4: User signs up
+
+        # Step 2: User chooses an activity with available spots
+        assert activity_index["with_free_slots"], "No activities with available spots found"
+        activity_name = activity_index["with_free_slots"][0]
+
+        # Step 3: User signs up
         test_email = "journey@test.com"
         response = client.post(
-            f"/activities/{activity_name}/signup?email={test_email}"
+            signup_url(activity_name), params={"email": test_email}
         )
         assert response.status_code == 200
         
-        # Step 5: Verify the signup was successful
-        response = client.get("/activities")
-        updated_activities = response.json()
-        assert test_email in updated_activities[activity_name]["participants"]
+        # Step 4: Verify the signup was successful, reading state in-process
+        from src.app import activities
+        assert test_email in activities[activity_name]["participants"]
 
-    def test_edge_case_email_formats(self, client):
+    @pytest.mark.parametrize("email", [
+        "simple@example.com",
+        "user.name@example.com",
+        "user+tag@example.org",
+        "user123@subdomain.example.com"
+    ])
+    def test_edge_case_email_formats(self, client, activity_catalog, email):
         """Test various email formats for signup"""
-        response = client.get("/activities")
-        activities_data = response.json()
-        activity_name = list(activities_data.keys())[0]
-        
-        # Test valid email formats
-        valid_emails = [
-            "simple@example.com",
-            "user.name@example.com",
-            "user+tag@example.org",
-            "user123@subdomain.example.com"
-        ]
-        
-        for email in valid_emails:
-            response = client.post(
-                f"/activities/{activity_name}/signup?email={email}"
-            )
-            # Should not fail due to email format (our API doesn't validate email format currently)
-            assert response.status_code in [200, 400]  # 400 if already signed up
+        activity_name = activity_catalog.first
 
-    def test_url_encoding_handling(self, client):
+        response = client.post(
+            signup_url(activity_name), params={"email": email}
+        )
+        # Should not fail due to email format (our API doesn't validate email format currently)
+        assert response.status_code in [200, 400]  # 400 if already signed up
+
+    def test_url_encoding_handling(self, client, activity_index, unique_email):
         """Test that URL encoding is handled properly"""
         # Test activity names with spaces (should be URL encoded)
-        response = client.get("/activities")
-        activities_data = response.json()
-        
-        # Find an activity with spaces in the name
-        activity_with_spaces = None
-        for name in activities_data.keys():
-            if " " in name:
-                activity_with_spaces = name
-                break
-        
+        names_with_spaces = activity_index["with_space_in_name"]
+        activity_with_spaces = names_with_spaces[0] if names_with_spaces else None
+
         if activity_with_spaces:
             # Test with proper URL encoding
             encoded_name = activity_with_spaces.replace(" ", "%20")
-            unique_email = f"urltest{hash(encoded_name) % 10000}@test.com"
             response = client.post(
-                f"/activities/{encoded_name}/signup?email={unique_email}"
+                f"/activities/{encoded_name}/signup?email={unique_email('urltest')}"
             )
             # Should succeed or fail due to capacity, but not due to URL encoding issues
             assert response.status_code in [200, 400]
@@ -89,19 +67,20 @@ class TestApplicationIntegration:
                 # Check it's not a URL encoding error
                 assert "not found" not in response.json()["detail"].lower()
 
-    def test_concurrent_signups(self, client):
-        """Test multiple signups happening concurrently"""
-        response = client.get("/activities")
-        activities_data = response.json()
-        activity_name = list(activities_data.keys())[0]
-        
-        # Multiple different users signing up
-        emails = [f"concurrent{i}@test.com" for i in range(5)]
-        
-        for email in emails:
-            response = client.post(
-                f"/activities/{activity_name}/signup?email={email}"
+    @pytest.mark.asyncio
+    async def test_concurrent_signups(self, async_client, activity_catalog):
+        """Test multiple signups actually happening concurrently"""
+        activity_name = activity_catalog.first
+
+        # Fire all signups in one asyncio.gather instead of sequential posts
+        results = await asyncio.gather(*[
+            async_client.post(
+                signup_url(activity_name), params={"email": f"concurrent{i}@test.com"}
             )
+            for i in range(5)
+        ])
+
+        for response in results:
             # Each should succeed (assuming activity has enough capacity)
             if response.status_code != 200:
                 # Might fail if activity gets full
@@ -112,39 +91,21 @@ class TestApplicationIntegration:
         """Test that activity capacity is properly managed"""
         # Create a test scenario by filling an activity to capacity
         from src.app import activities
-        
+
         # Find an activity and get its capacity
         activity_name = list(activities.keys())[0]
         activity = activities[activity_name]
         max_capacity = activity["max_participants"]
-        
-        # Clear existing participants for clean test
-        original_participants = activity["participants"].copy()
-        activity["participants"] = []
-        
-        try:
-            # Fill to capacity
-            for i in range(max_capacity):
-                response = client.post(
-                    f"/activities/{activity_name}/signup?email=capacity{i}@test.com"
-                )
-                assert response.status_code == 200
-            
-            # Verify activity is now full
-            response = client.get("/activities")
-            updated_data = response.json()
-            assert len(updated_data[activity_name]["participants"]) == max_capacity
-            
-            # Try to add one more (should fail)
-            response = client.post(
-                f"/activities/{activity_name}/signup?email=overflow@test.com"
-            )
-            assert response.status_code == 400
-            assert "full" in response.json()["detail"]
-            
-        finally:
-            # Restore original participants
-            activity["participants"] = original_participants
+
+        # Fill to capacity directly; reset_activities restores afterwards
+        activity["participants"] = [f"capacity{i}@test.com" for i in range(max_capacity)]
+
+        # Try to add one more (should fail)
+        response = client.post(
+            signup_url(activity_name), params={"email": "overflow@test.com"}
+        )
+        assert response.status_code == 400
+        assert "full" in response.json()["detail"]
 
 
 class TestErrorHandling:
@@ -171,19 +132,16 @@ class TestErrorHandling:
         # Should return 404 since this activity doesn't exist
         assert response.status_code == 404
 
-    def test_very_long_email_addresses(self, client):
+    def test_very_long_email_addresses(self, client, activity_catalog, unique_email):
         """Test handling of very long email addresses"""
-        response = client.get("/activities")
-        activities_data = response.json()
-        activity_name = list(activities_data.keys())[0]
-        
+        activity_name = activity_catalog.first
+
         # Create a very long email with unique content to avoid duplicates
-        import time
-        timestamp = str(int(time.time() * 1000000))
-        long_email = "a" * 50 + timestamp + "@" + "b" * 50 + ".com"
+        unique_part = unique_email("long").partition("@")[0]
+        long_email = "a" * 50 + unique_part + "@" + "b" * 50 + ".com"
         
         response = client.post(
-            f"/activities/{activity_name}/signup?email={long_email}"
+            signup_url(activity_name), params={"email": long_email}
         )
         # Should work unless activity is full
         assert response.status_code in [200, 400]